@@ -2,13 +2,22 @@
 # -*- coding: utf-8 -*-
 """
 批量下载 YouTube 视频
-从文件中读取多个 URL 进行批量下载
+从文件中读取多个 URL 进行批量下载（多线程并发）
 """
 
+import os
 import sys
+import time
+import queue
 import shutil
+import argparse
+import threading
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from collections import defaultdict, deque
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from yt_dlp import YoutubeDL
@@ -18,63 +27,183 @@ except ImportError:
     sys.exit(1)
 
 
+# 默认并发下载数（下载是 I/O 密集型任务，多个视频可以同时下载）
+DEFAULT_JOBS = 4
+
+# 同一个主机（如 youtube.com）的最大同时下载数
+# 并发太高容易触发服务器限速/验证码，反而更慢
+DEFAULT_PER_HOST = 4
+
+# HLS/DASH 分片的并发下载数（分片串行下载时延迟是主要瓶颈）
+DEFAULT_CONCURRENT_FRAGMENTS = 8
+
+# 普通（非分片）下载的 HTTP 分块大小：10MB，允许按 Range 并行取块
+HTTP_CHUNK_SIZE = 10485760
+
+# 待下载队列的容量：限制内存占用为 O(队列大小) 而不是 O(链接总数)
+URL_QUEUE_SIZE = 64
+
+# 同时预解析的 URL 数：元数据请求和下载流水线并行，
+# 下一批视频的解析延迟被当前下载的传输时间掩盖
+META_PREFETCH = 8
+
+# 跨运行持久化的 Cookie 文件：多次运行之间保留会话状态
+COOKIE_FILE = os.path.expanduser('~/.ytdownload/cookies.txt')
+
+# 保持连接复用：大量小请求（分片、字幕）时省去重复的 TCP+TLS 握手
+# 不声明 br：brotli 不是 yt-dlp 的必装依赖，没装的环境会收到解不开的响应
+HTTP_HEADERS = {'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'}
+
+# 下载根目录（常量便于测试时替换）
+DOWNLOAD_ROOT = Path('./downloads')
+
+
+def default_download_dir():
+    """默认下载目录：downloads/年-月-日（在入口处调用一次，跨午夜也不会变）"""
+    return DOWNLOAD_ROOT / datetime.now().strftime('%Y-%m-%d')
+
+# 并发下载时多个线程同时打印会互相覆盖，用锁保证每行输出完整
+_print_lock = threading.Lock()
+
+# 每个下载线程进度输出的最小间隔（秒）：yt-dlp 每秒回调很多次，
+# 每次打印都是一次系统调用，并发时还会争抢输出锁
+_PROGRESS_INTERVAL = 0.2
+
+
+@lru_cache(maxsize=None)
 def check_ffmpeg():
-    """检查 FFmpeg 是否已安装"""
+    """检查 FFmpeg 是否已安装（结果缓存：PATH 在进程内不会变）"""
     return shutil.which('ffmpeg') is not None
 
 
-def download_progress_hook(d):
-    """下载进度回调"""
-    if d['status'] == 'downloading':
-        if '_percent_str' in d:
-            speed_str = d.get('_speed_str', 'N/A')
-            print(f"\r  下载中: {d['_percent_str']} | 速度: {speed_str}", end='', flush=True)
-    elif d['status'] == 'finished':
-        print("\n  ✅ 下载完成")
+def make_progress_hook(states, lock):
+    """
+    生成带编号的下载进度回调
+
+    并发下载时不能用 \\r 覆盖行（多个线程的输出会互相干扰），
+    改为每次输出完整的一行，并带上 [编号] 前缀。
+    每个下载的状态按 URL 登记在共享的 states 字典里：开启分片并发后
+    yt-dlp 会从自己的分片线程触发回调，不能假设回调发生在提交下载的线程。
+    """
+    def hook(d):
+        info = d.get('info_dict') or {}
+        key = info.get('original_url') or info.get('webpage_url')
+        with lock:
+            state = states.get(key)
+        if state is None:
+            return  # 不是本批次登记过的下载
+        if d['status'] == 'downloading':
+            # 节流：每个下载最多每 0.2 秒输出一行
+            now = time.monotonic()
+            with lock:
+                if now - state['last_emit'] < _PROGRESS_INTERVAL:
+                    return
+                state['last_emit'] = now
+            if '_percent_str' in d:
+                speed_str = d.get('_speed_str', 'N/A')
+                with _print_lock:
+                    sys.stdout.write(f"  [{state['index']}] 下载中: {d['_percent_str']} | 速度: {speed_str}\n")
+                    sys.stdout.flush()
+        elif d['status'] == 'finished':
+            # 记录本次下载实际拿到的字幕，后面据此判断是否需要 fallback
+            # （直接查 yt-dlp 自己的记录，避免每个 URL 都扫描一遍下载目录）
+            with lock:
+                state['finished'] = True
+                state['requested_subtitles'] = info.get('requested_subtitles')
+            with _print_lock:
+                print(f"  [{state['index']}] ✅ 下载完成", flush=True)
+    return hook
+
+
+def iter_urls(file_path):
+    """逐行读取 URL 文件，跳过空行和 # 注释行（不把整个文件读进内存）"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            url = line.strip()
+            if url and not url.startswith('#'):
+                yield url
 
 
-def batch_download_from_file(file_path, output_dir="./downloads", quality="best", audio_only=False):
+def resolve_one(meta_ydl, url):
+    """
+    预解析单个 URL：无效链接返回空列表，播放列表展开成视频链接列表
+
+    解析只取元数据（extract_flat），不下载。
+    """
+    resolved = []
+    try:
+        info = meta_ydl.extract_info(url, download=False, process=False)
+        if info is None:
+            with _print_lock:
+                print(f"⚠️  跳过无效链接: {url}", flush=True)
+            return []
+        entries = info.get('entries')
+        if entries is None:
+            return [url]
+        # 播放列表：展开成单个视频链接。
+        # process=False 时 entries 可能是惰性生成器，翻页请求发生在
+        # 迭代过程中，中途出错也要把已经拿到的条目交出去
+        for entry in entries:
+            video_url = entry.get('url') or entry.get('webpage_url')
+            if video_url:
+                resolved.append(video_url)
+    except Exception:
+        with _print_lock:
+            if resolved:
+                print(f"⚠️  播放列表解析中断，已获取 {len(resolved)} 条: {url}", flush=True)
+            else:
+                print(f"⚠️  跳过无效链接: {url}", flush=True)
+    return resolved
+
+
+def batch_download_from_file(file_path, output_dir="./downloads", quality="best",
+                             audio_only=False, jobs=DEFAULT_JOBS, per_host=DEFAULT_PER_HOST,
+                             concurrent_frags=DEFAULT_CONCURRENT_FRAGMENTS):
     """
     从文件中批量下载视频
-    
+
     Args:
         file_path: 包含 URL 列表的文件路径（每行一个 URL）
         output_dir: 下载保存目录
         quality: 视频质量
         audio_only: 是否只下载音频
+        jobs: 并发下载数
+        per_host: 同一主机的最大同时下载数
+        concurrent_frags: HLS/DASH 分片并发下载数
     """
-    # 读取 URL 列表
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-    except FileNotFoundError:
+    if not Path(file_path).is_file():
         print(f"❌ 文件不存在: {file_path}")
         sys.exit(1)
-    except Exception as e:
-        print(f"❌ 读取文件失败: {str(e)}")
-        sys.exit(1)
-    
-    if not urls:
-        print("❌ 文件中没有找到任何 URL")
-        sys.exit(1)
-    
-    print(f"\n📋 找到 {len(urls)} 个视频链接")
-    print(f"📁 保存到: {output_dir}\n")
+
+    # 每个主机一个信号量，限制对同一主机的并发请求数
+    host_sems = defaultdict(lambda: threading.Semaphore(per_host))
+
+    print(f"\n📋 从 {file_path} 流式读取视频链接")
+    print(f"📁 保存到: {output_dir}")
+    print(f"🚀 并发数: {jobs}\n")
     print("="*60)
-    
+
     # 创建输出目录
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-    
+    if not output_path.is_dir():  # 先 stat 一次，目录已存在时省掉逐级 mkdir 系统调用
+        output_path.mkdir(parents=True, exist_ok=True)
+
     # 配置下载选项
     ydl_opts = {
         'outtmpl': str(output_path / '%(title)s.%(ext)s'),
-        'progress_hooks': [download_progress_hook],
         'quiet': False,
         'no_warnings': False,
         'ignoreerrors': True,  # 某个视频失败时继续
+        'concurrent_fragment_downloads': concurrent_frags,  # HLS/DASH 分片并发下载
+        'http_chunk_size': HTTP_CHUNK_SIZE,  # 非分片下载时按块并行
+        'cookiefile': COOKIE_FILE,  # Cookie 跨运行持久化
+        'http_headers': HTTP_HEADERS,  # 连接复用
+        'socket_timeout': 30,
     }
-    
+    cookie_dir = Path(COOKIE_FILE).parent
+    if not cookie_dir.is_dir():
+        cookie_dir.mkdir(parents=True, exist_ok=True)
+
     # 字幕下载配置（仅在下载视频时启用，优先英文和中文，如果都没有则下载任意可用字幕）
     if not audio_only:
         ydl_opts.update({
@@ -84,7 +213,7 @@ def batch_download_from_file(file_path, output_dir="./downloads", quality="best"
             'subtitleformat': 'srt',        # 字幕格式为SRT
             'allsubtitles': False,          # 不下载所有语言
         })
-    
+
     if audio_only:
         ydl_opts['format'] = 'bestaudio/best'
         if check_ffmpeg():
@@ -102,41 +231,249 @@ def batch_download_from_file(file_path, output_dir="./downloads", quality="best"
             height = quality[:-1]
             ydl_opts['format'] = f'bestvideo[ext=mp4][height<={height}][vcodec^=avc]+bestaudio[ext=m4a]/best[height<={height}]'
             ydl_opts['merge_output_format'] = 'mp4'
-    
-    # 批量下载
+
+        if ydl_opts.get('merge_output_format') == 'mp4':
+            # 合并时只做流拷贝，确保 ffmpeg 不会重新编码；
+            # +faststart 把 moov 移到文件头，下载完即可边传边播
+            ydl_opts['postprocessor_args'] = {
+                'ffmpeg': ['-c', 'copy', '-movflags', '+faststart'],
+            }
+
+    # 每个工作线程复用一个长期存活的 YoutubeDL 实例
+    # 避免每个 URL 重新初始化提取器、丢弃已建立的连接池
+    tls = threading.local()
+    all_ydls = []  # 记录所有创建的实例，结束时统一关闭
+    all_ydls_lock = threading.Lock()
+
+    # 每个下载的状态（编号、节流时间戳、拿到的字幕）按 URL 登记在共享字典里，
+    # 回调不依赖调用线程；一个回调对象所有实例共用
+    download_states = {}
+    states_lock = threading.Lock()
+    worker_hook = make_progress_hook(download_states, states_lock)
+
+    def get_worker_ydl():
+        """获取当前线程的 YoutubeDL 实例（首次调用时创建）"""
+        if not hasattr(tls, 'ydl'):
+            # 每个实例仍然要有自己的选项字典（yt-dlp 会就地修改 params）
+            opts = dict(ydl_opts)
+            opts['progress_hooks'] = [worker_hook]
+            tls.ydl = YoutubeDL(opts)
+            with all_ydls_lock:
+                all_ydls.append(tls.ydl)
+        return tls.ydl
+
+    # 主下载完成后缺少字幕的 URL 先记下来，最后统一做 fallback 下载
+    fallback_urls = []
+    fallback_lock = threading.Lock()
+
+    def download_one(url, index):
+        """下载单个视频（在工作线程中运行）"""
+        with _print_lock:
+            print(f"\n[{index}] 下载: {url}", flush=True)
+        with states_lock:
+            download_states[url] = {
+                'index': index,
+                'last_emit': 0.0,
+                'finished': False,
+                'requested_subtitles': None,
+            }
+        ydl = get_worker_ydl()
+        host = urlparse(url).hostname or ''
+        with host_sems[host]:
+            ydl.download([url])
+
+        with states_lock:
+            # 容忍同一链接重复在途：后一次 pop 拿到 None 就算了，
+            # 绝不能让 KeyError 把一次成功的下载统计成失败
+            state = download_states.pop(url, None)
+        # 进度回调记录了本次拿到的字幕；下载成功但没有字幕才排进 fallback 队列
+        # （下载失败时 'finished' 不会触发，再去要字幕也没有意义）
+        if (state is not None and not audio_only
+                and state['finished'] and not state['requested_subtitles']):
+            with fallback_lock:
+                fallback_urls.append(url)
+
+    # 流式生产/消费：读文件的线程边解析边往有界队列里放链接，
+    # 下载线程边取边下。内存占用与队列大小成正比，而不是链接总数；
+    # 文件还没读完，第一个下载就已经开始了。
+    url_queue = queue.Queue(maxsize=URL_QUEUE_SIZE)
+    stop_event = threading.Event()
+
+    def produce():
+        """读取并预解析 URL，送入下载队列（去重，展开播放列表）
+
+        解析用一个小线程池预取：后面 URL 的元数据请求和前面视频的
+        下载同时进行，解析延迟不再占用下载的关键路径。
+        """
+        seen = set()    # 原始输入行去重：重复行不用再解析一次
+        queued = set()  # 解析后的视频链接去重：播放列表展开也走这一层
+        index = 0
+        meta_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'ignoreerrors': True,
+            'extract_flat': 'in_playlist',  # 播放列表只列出条目，不逐个完整解析
+        }
+        # 按提交顺序保存在途的解析任务，窗口大小固定，内存仍然有界
+        pending = deque()
+
+        # YoutubeDL 不是线程安全的：和下载线程一样，
+        # 每个预解析线程用自己的实例，结束时统一关闭
+        meta_tls = threading.local()
+        meta_ydls = []
+        meta_ydls_lock = threading.Lock()
+
+        def get_meta_ydl():
+            """获取当前预解析线程的 YoutubeDL 实例（首次调用时创建）"""
+            if not hasattr(meta_tls, 'ydl'):
+                meta_tls.ydl = YoutubeDL(dict(meta_opts))
+                with meta_ydls_lock:
+                    meta_ydls.append(meta_tls.ydl)
+            return meta_tls.ydl
+
+        def resolve_task(url):
+            return resolve_one(get_meta_ydl(), url)
+
+        def put_resolved(future):
+            nonlocal index
+            for video_url in future.result():
+                if stop_event.is_set():
+                    return
+                if video_url in queued:
+                    continue  # 同一视频单独列出又出现在播放列表里，只下载一次
+                queued.add(video_url)
+                index += 1
+                url_queue.put((index, video_url))
+
+        try:
+            with ThreadPoolExecutor(max_workers=META_PREFETCH) as meta_pool:
+                for url in iter_urls(file_path):
+                    if stop_event.is_set():
+                        break
+                    if url in seen:
+                        continue  # 重复行连解析都省掉
+                    seen.add(url)
+                    pending.append(meta_pool.submit(resolve_task, url))
+                    if len(pending) > META_PREFETCH:
+                        put_resolved(pending.popleft())
+                while pending:
+                    put_resolved(pending.popleft())
+        except Exception as e:
+            with _print_lock:
+                print(f"❌ 读取文件失败: {str(e)}", flush=True)
+        finally:
+            for ydl in meta_ydls:
+                ydl.__exit__(None, None, None)
+            # 每个下载线程一个结束标记
+            for _ in range(jobs):
+                url_queue.put(None)
+
+    def worker():
+        """不断从队列取链接下载，直到收到结束标记"""
+        ok = 0
+        fail = 0
+        while True:
+            item = url_queue.get()
+            if item is None:
+                break
+            if stop_event.is_set():
+                continue  # 取消后只清空队列，不再下载
+            index, url = item
+            try:
+                download_one(url, index)
+                ok += 1
+            except Exception as e:
+                with _print_lock:
+                    print(f"\n  ❌ 下载失败: {url}: {str(e)}", flush=True)
+                fail += 1
+        return ok, fail
+
+    # 批量并发下载
     success_count = 0
     fail_count = 0
-    
-    for i, url in enumerate(urls, 1):
-        print(f"\n[{i}/{len(urls)}] 下载: {url}")
-        try:
-            with YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-                
-                # 检查是否有字幕文件，如果没有，尝试下载任意可用字幕
-                if not audio_only:
-                    subtitle_files = list(output_path.glob('*.srt'))
-                    if not subtitle_files:
-                        print("  ⚠️  优先语言（英文/中文）字幕不可用，尝试下载任意可用字幕...")
-                        fallback_opts = ydl_opts.copy()
-                        # 移除语言限制，但只下载一个字幕（通过不设置allsubtitles）
-                        fallback_opts.pop('subtitleslangs', None)  # 移除语言限制
-                        fallback_opts['allsubtitles'] = False  # 只下载一个字幕
-                        fallback_opts['skip_download'] = True  # 只下载字幕，不重复下载视频
+    interrupted = False
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    futures = []
+    try:
+        futures = [executor.submit(worker) for _ in range(jobs)]
+        # 等所有工作线程退出；统计在 finally 里统一收集
+        for future in as_completed(futures):
+            future.result()
+    except KeyboardInterrupt:
+        print("\n\n⚠️  用户取消下载")
+        interrupted = True
+        stop_event.set()
+        # 清空队列，让可能阻塞在 put 上的生产者退出
+        while not url_queue.empty():
+            try:
+                url_queue.get_nowait()
+            except queue.Empty:
+                break
+        # 重新补上结束标记（可能在上面清空队列时被一起清掉了）
+        for _ in range(jobs):
+            try:
+                url_queue.put_nowait(None)
+            except queue.Full:
+                break
+    finally:
+        # 等工作线程退出（取消后它们最多再下完当前一个视频）并收集统计；
+        # 只在这里累计一次，取消与否都不会重复计数
+        for future in futures:
+            try:
+                ok, fail = future.result()
+            except Exception:
+                continue
+            success_count += ok
+            fail_count += fail
+        executor.shutdown()
+        # 此时没有线程还在用这些实例，可以安全关闭
+        for ydl in all_ydls:
+            ydl.__exit__(None, None, None)
+
+    if success_count == 0 and fail_count == 0 and not interrupted:
+        print("❌ 文件中没有找到任何可下载的 URL")
+        sys.exit(1)
+
+    # 统一处理缺少字幕的视频：fallback 也多线程跑，
+    # 每个 URL 只是一次元数据请求 + 一个小字幕文件，并发收益明显
+    if fallback_urls and not interrupted:
+        print(f"\n⚠️  {len(fallback_urls)} 个视频的优先语言（英文/中文）字幕不可用，尝试下载任意可用字幕...")
+        # 显式构造，不从 ydl_opts 浅拷贝：浅拷贝会共享
+        # postprocessors 等列表，fallback 一改就污染主配置
+        fallback_opts = {
+            'outtmpl': ydl_opts['outtmpl'],
+            'writesubtitles': True,          # 下载手动字幕
+            'writeautomaticsub': True,       # 下载自动生成的字幕
+            'subtitleformat': 'srt',         # 字幕格式为SRT
+            'allsubtitles': False,           # 只下载一个字幕（无语言限制）
+            'skip_download': True,           # 只下载字幕，不重复下载视频
+            'quiet': True,
+            'ignoreerrors': True,
+        }
+
+        def fallback_worker(chunk):
+            """一个线程处理一批 fallback URL，整批复用同一个实例"""
+            with YoutubeDL(dict(fallback_opts)) as ydl_fallback:
+                for url in chunk:
+                    with host_sems[urlparse(url).hostname or '']:
                         try:
-                            with YoutubeDL(fallback_opts) as ydl_fallback:
-                                ydl_fallback.download([url])
+                            ydl_fallback.download([url])
                         except Exception:
                             pass  # 如果fallback也失败，就跳过
-                
-                success_count += 1
+
+        workers = min(jobs, len(fallback_urls))
+        chunks = [fallback_urls[i::workers] for i in range(workers)]
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for _ in pool.map(fallback_worker, chunks):
+                    pass
         except KeyboardInterrupt:
-            print("\n\n⚠️  用户取消下载")
-            break
-        except Exception as e:
-            print(f"\n  ❌ 下载失败: {str(e)}")
-            fail_count += 1
-    
+            print("\n\n⚠️  用户取消字幕下载")
+
     # 显示统计
     print("\n" + "="*60)
     print(f"  下载完成!")
@@ -146,37 +483,51 @@ def batch_download_from_file(file_path, output_dir="./downloads", quality="best"
 
 
 def main():
-    """主函数 - 交互式批量下载 - 默认最高质量"""
+    """主函数 - 批量下载 - 默认最高质量"""
+    parser = argparse.ArgumentParser(description='YouTube 批量下载器')
+    parser.add_argument('file', nargs='?', help='URL 列表文件路径（每行一个 URL）')
+    parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'并发下载数 (默认: {DEFAULT_JOBS})')
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST,
+                        help=f'同一主机的最大同时下载数 (默认: {DEFAULT_PER_HOST})')
+    parser.add_argument('-c', '--concurrent-frags', type=int,
+                        default=DEFAULT_CONCURRENT_FRAGMENTS,
+                        help=f'HLS/DASH 分片并发下载数 (默认: {DEFAULT_CONCURRENT_FRAGMENTS})')
+    args = parser.parse_args()
+
     print("\n" + "="*60)
     print("  YouTube 批量下载器 - 自动最高质量")
     print("="*60 + "\n")
-    
-    print("使用方法:")
-    print("1. 创建一个文本文件（如 urls.txt）")
-    print("2. 每行写一个 YouTube 视频 URL")
-    print("3. 以 # 开头的行会被忽略（可作为注释）\n")
-    print("示例文件内容:")
-    print("  # 我喜欢的视频列表")
-    print("  https://www.youtube.com/watch?v=VIDEO_ID_1")
-    print("  https://www.youtube.com/watch?v=VIDEO_ID_2")
-    print("  https://www.youtube.com/watch?v=VIDEO_ID_3\n")
-    print("-"*60)
-    
-    # 获取文件路径
-    file_path = input("\n请输入 URL 列表文件路径: ").strip()
+
+    file_path = args.file
     if not file_path:
-        print("❌ 文件路径不能为空！")
-        return
-    
-    # 使用日期创建下载文件夹（年月日格式）
-    date_folder = datetime.now().strftime("%Y-%m-%d")
-    download_dir = f"./downloads/{date_folder}"
-    
+        print("使用方法:")
+        print("1. 创建一个文本文件（如 urls.txt）")
+        print("2. 每行写一个 YouTube 视频 URL")
+        print("3. 以 # 开头的行会被忽略（可作为注释）\n")
+        print("示例文件内容:")
+        print("  # 我喜欢的视频列表")
+        print("  https://www.youtube.com/watch?v=VIDEO_ID_1")
+        print("  https://www.youtube.com/watch?v=VIDEO_ID_2")
+        print("  https://www.youtube.com/watch?v=VIDEO_ID_3\n")
+        print("-"*60)
+
+        # 获取文件路径
+        file_path = input("\n请输入 URL 列表文件路径: ").strip()
+        if not file_path:
+            print("❌ 文件路径不能为空！")
+            return
+
+    # 使用日期创建下载文件夹（年月日格式），只计算一次
+    download_dir = str(default_download_dir())
+
     print(f"\n📹 开始批量下载（最高质量）...")
     print(f"📁 保存到: {download_dir}\n")
-    
+
     # 默认最高质量
-    batch_download_from_file(file_path, download_dir, "best", False)
+    batch_download_from_file(file_path, download_dir, "best", False,
+                             jobs=args.jobs, per_host=args.per_host,
+                             concurrent_frags=args.concurrent_frags)
 
 
 if __name__ == '__main__':
@@ -185,4 +536,3 @@ if __name__ == '__main__':
     except KeyboardInterrupt:
         print("\n\n👋 再见！\n")
         sys.exit(0)
-
@@ -5,9 +5,13 @@
 支持下载单个视频或播放列表
 """
 
+import os
+import re
 import sys
+import time
 import argparse
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 try:
@@ -17,21 +21,46 @@ except ImportError:
     sys.exit(1)
 
 
+@lru_cache(maxsize=None)
 def check_ffmpeg():
-    """检查 FFmpeg 是否已安装"""
+    """检查 FFmpeg 是否已安装（结果缓存：PATH 在进程内不会变）"""
     return shutil.which('ffmpeg') is not None
 
 
-def get_download_options(output_path, quality="best", audio_only=False, is_playlist=False):
+# HLS/DASH 分片的并发下载数（分片串行下载时延迟是主要瓶颈）
+DEFAULT_CONCURRENT_FRAGMENTS = 8
+
+# 普通（非分片）下载的 HTTP 分块大小：10MB，允许按 Range 并行取块
+HTTP_CHUNK_SIZE = 10485760
+
+# 跨运行持久化的 Cookie 文件：多次运行之间保留会话状态
+COOKIE_FILE = os.path.expanduser('~/.ytdownload/cookies.txt')
+
+# 保持连接复用：大量小请求（分片、字幕）时省去重复的 TCP+TLS 握手
+# 不声明 br：brotli 不是 yt-dlp 的必装依赖，没装的环境会收到解不开的响应
+HTTP_HEADERS = {'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'}
+
+# 下载根目录（常量便于测试时替换）
+DOWNLOAD_ROOT = Path('./downloads')
+
+
+def default_download_dir():
+    """默认下载目录：downloads/年-月-日（在入口处调用一次，跨午夜也不会变）"""
+    return DOWNLOAD_ROOT / datetime.now().strftime('%Y-%m-%d')
+
+
+def get_download_options(output_path, quality="best", audio_only=False, is_playlist=False,
+                         concurrent_frags=DEFAULT_CONCURRENT_FRAGMENTS):
     """
     获取下载配置选项
-    
+
     Args:
         output_path: 输出路径
         quality: 视频质量
         audio_only: 是否只下载音频
         is_playlist: 是否为播放列表
-        
+        concurrent_frags: HLS/DASH 分片并发下载数
+
     Returns:
         dict: yt-dlp 配置选项
     """
@@ -47,7 +76,15 @@ def get_download_options(output_path, quality="best", audio_only=False, is_playl
         'no_warnings': False,
         'ignoreerrors': True,  # 播放列表中某个视频失败时继续
         'progress_hooks': [download_progress_hook],
+        'concurrent_fragment_downloads': concurrent_frags,  # HLS/DASH 分片并发下载
+        'http_chunk_size': HTTP_CHUNK_SIZE,  # 非分片下载时按块并行
+        'cookiefile': COOKIE_FILE,  # Cookie 跨运行持久化
+        'http_headers': HTTP_HEADERS,  # 连接复用
+        'socket_timeout': 30,
     }
+    cookie_dir = Path(COOKIE_FILE).parent
+    if not cookie_dir.is_dir():
+        cookie_dir.mkdir(parents=True, exist_ok=True)
     
     # 字幕下载配置（仅在下载视频时启用，音频不需要字幕）
     if not audio_only:
@@ -89,51 +126,93 @@ def get_download_options(output_path, quality="best", audio_only=False, is_playl
             height = quality[:-1]
             ydl_opts['format'] = f'bestvideo[ext=mp4][height<={height}][vcodec^=avc]+bestaudio[ext=m4a]/best[height<={height}]'
             ydl_opts['merge_output_format'] = 'mp4'  # 合并后输出为mp4
-    
+
+        if ydl_opts.get('merge_output_format') == 'mp4':
+            # 合并时只做流拷贝，确保 ffmpeg 不会重新编码；
+            # +faststart 把 moov 移到文件头，下载完即可边传边播
+            ydl_opts['postprocessor_args'] = {
+                'ffmpeg': ['-c', 'copy', '-movflags', '+faststart'],
+            }
+
     return ydl_opts
 
 
+# 进度输出的最小间隔（秒）：yt-dlp 每秒回调很多次，每次打印都是一次系统调用
+_PROGRESS_INTERVAL = 0.2
+_last_emit = [0.0]
+
+
 def download_progress_hook(d):
-    """下载进度回调"""
+    """下载进度回调（节流：最多每 0.2 秒刷新一次）"""
     if d['status'] == 'downloading':
+        now = time.monotonic()
+        if now - _last_emit[0] < _PROGRESS_INTERVAL:
+            return
+        _last_emit[0] = now
         # 显示下载进度
         if 'total_bytes' in d:
             percent = d['downloaded_bytes'] / d['total_bytes'] * 100
             speed = d.get('speed', 0)
             speed_str = f"{speed/1024/1024:.2f} MB/s" if speed else "N/A"
-            print(f"\r下载中: {percent:.1f}% | 速度: {speed_str}", end='', flush=True)
+            sys.stdout.write(f"\r下载中: {percent:.1f}% | 速度: {speed_str}")
+            sys.stdout.flush()
         elif '_percent_str' in d:
-            print(f"\r下载中: {d['_percent_str']} | 速度: {d.get('_speed_str', 'N/A')}", end='', flush=True)
+            sys.stdout.write(f"\r下载中: {d['_percent_str']} | 速度: {d.get('_speed_str', 'N/A')}")
+            sys.stdout.flush()
     elif d['status'] == 'finished':
         print("\n处理完成，正在合并文件...")
 
 
+# YouTube 域名匹配：一次正则扫描代替逐个子串查找，
+# 且要求域名出现在主机名位置，不会误判 notyoutube.com.evil 之类的链接；
+# 子域名任意（www/m/music/gaming 等都是合法的 YouTube 主机）
+_YT_RE = re.compile(
+    r'(?:^|//)(?:[\w-]+\.)*(?:youtube(?:-nocookie)?\.com|youtu\.be)(?:/|$)',
+    re.IGNORECASE)
+
+
 def validate_url(url):
     """
     验证 URL 是否为有效的 YouTube URL
-    
+
     Args:
         url: 待验证的 URL
-        
+
     Returns:
         bool: 是否有效
     """
-    youtube_domains = ['youtube.com', 'youtu.be', 'youtube-nocookie.com', 'm.youtube.com']
-    return any(domain in url.lower() for domain in youtube_domains)
+    return bool(_YT_RE.search(url))
+
+
+def has_srt(dirpath):
+    """
+    检查目录下是否已有 .srt 字幕文件
+
+    用 os.scandir 顺序扫描、找到第一个就返回：比 Path.glob 省去
+    每个文件的 Path 构造和 fnmatch 匹配，目录大时差别明显。
+    """
+    with os.scandir(dirpath) as it:
+        return any(entry.name.endswith('.srt') for entry in it)
 
 
-def download_video(url, output_dir="./downloads", quality="best", audio_only=False):
+def download_video(url, output_dir="./downloads", quality="best", audio_only=False,
+                   concurrent_frags=DEFAULT_CONCURRENT_FRAGMENTS, strict=True):
     """
     下载 YouTube 视频
-    
+
     Args:
         url: YouTube 视频 URL
         output_dir: 下载保存目录
         quality: 视频质量 ('best', 'worst', '1080p', '720p', '480p' 等)
         audio_only: 是否只下载音频
+        concurrent_frags: HLS/DASH 分片并发下载数
+        strict: URL 无效时直接抛 ValueError；设为 False 才交互确认
+                （脚本/批量调用不能阻塞在 input 上等人回答）
     """
     # 验证 URL
     if not validate_url(url):
+        if strict:
+            raise ValueError(f"不是有效的 YouTube 链接: {url}")
         print(f"⚠️  警告: URL 可能不是有效的 YouTube 链接: {url}")
         response = input("是否继续? (y/n): ").strip().lower()
         if response != 'y':
@@ -142,10 +221,12 @@ def download_video(url, output_dir="./downloads", quality="best", audio_only=Fal
     
     # 创建输出目录
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    if not output_path.is_dir():  # 先 stat 一次，目录已存在时省掉逐级 mkdir 系统调用
+        output_path.mkdir(parents=True, exist_ok=True)
     
     # 获取下载配置
-    ydl_opts = get_download_options(output_path, quality, audio_only, is_playlist=False)
+    ydl_opts = get_download_options(output_path, quality, audio_only, is_playlist=False,
+                                    concurrent_frags=concurrent_frags)
     
     try:
         with YoutubeDL(ydl_opts) as ydl:
@@ -155,14 +236,20 @@ def download_video(url, output_dir="./downloads", quality="best", audio_only=Fal
             
             # 检查是否有字幕文件，如果没有，尝试下载任意可用字幕
             if not audio_only:
-                subtitle_files = list(output_path.glob('*.srt'))
-                if not subtitle_files:
+                if not has_srt(output_path):
                     print("⚠️  优先语言（英文/中文）字幕不可用，尝试下载任意可用字幕...")
-                    fallback_opts = ydl_opts.copy()
-                    # 移除语言限制，但只下载一个字幕（通过不设置allsubtitles）
-                    fallback_opts.pop('subtitleslangs', None)  # 移除语言限制
-                    fallback_opts['allsubtitles'] = False  # 只下载一个字幕
-                    fallback_opts['skip_download'] = True  # 只下载字幕，不重复下载视频
+                    # 显式构造，不从 ydl_opts 浅拷贝：浅拷贝会共享
+                    # postprocessors/progress_hooks 等列表，fallback 一改就污染主配置
+                    fallback_opts = {
+                        'outtmpl': ydl_opts['outtmpl'],
+                        'writesubtitles': True,          # 下载手动字幕
+                        'writeautomaticsub': True,       # 下载自动生成的字幕
+                        'subtitleformat': 'srt',         # 字幕格式为SRT
+                        'allsubtitles': False,           # 只下载一个字幕（无语言限制）
+                        'skip_download': True,           # 只下载字幕，不重复下载视频
+                        'quiet': True,
+                        'ignoreerrors': True,
+                    }
                     try:
                         with YoutubeDL(fallback_opts) as ydl_fallback:
                             ydl_fallback.download([url])
@@ -183,18 +270,24 @@ def download_video(url, output_dir="./downloads", quality="best", audio_only=Fal
         sys.exit(1)
 
 
-def download_playlist(url, output_dir="./downloads", quality="best", audio_only=False):
+def download_playlist(url, output_dir="./downloads", quality="best", audio_only=False,
+                      concurrent_frags=DEFAULT_CONCURRENT_FRAGMENTS, strict=True):
     """
     下载 YouTube 播放列表
-    
+
     Args:
         url: YouTube 播放列表 URL
         output_dir: 下载保存目录
         quality: 视频质量
         audio_only: 是否只下载音频
+        concurrent_frags: HLS/DASH 分片并发下载数
+        strict: URL 无效时直接抛 ValueError；设为 False 才交互确认
+                （脚本/批量调用不能阻塞在 input 上等人回答）
     """
     # 验证 URL
     if not validate_url(url):
+        if strict:
+            raise ValueError(f"不是有效的 YouTube 链接: {url}")
         print(f"⚠️  警告: URL 可能不是有效的 YouTube 链接: {url}")
         response = input("是否继续? (y/n): ").strip().lower()
         if response != 'y':
@@ -203,10 +296,12 @@ def download_playlist(url, output_dir="./downloads", quality="best", audio_only=
     
     # 创建输出目录
     output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    if not output_path.is_dir():  # 先 stat 一次，目录已存在时省掉逐级 mkdir 系统调用
+        output_path.mkdir(parents=True, exist_ok=True)
     
     # 获取下载配置
-    ydl_opts = get_download_options(output_path, quality, audio_only, is_playlist=True)
+    ydl_opts = get_download_options(output_path, quality, audio_only, is_playlist=True,
+                                    concurrent_frags=concurrent_frags)
     
     try:
         with YoutubeDL(ydl_opts) as ydl:
@@ -260,6 +355,9 @@ def main():
                         help='只下载音频（MP3格式，需要 FFmpeg）')
     parser.add_argument('-p', '--playlist', action='store_true',
                         help='下载播放列表')
+    parser.add_argument('-c', '--concurrent-frags', type=int,
+                        default=DEFAULT_CONCURRENT_FRAGMENTS,
+                        help=f'HLS/DASH 分片并发下载数 (默认: {DEFAULT_CONCURRENT_FRAGMENTS})')
     parser.add_argument('--check-ffmpeg', action='store_true',
                         help='检查 FFmpeg 是否已安装')
     
@@ -282,10 +380,9 @@ def main():
         parser.print_help()
         sys.exit(1)
     
-    # 如果没有指定输出目录，使用日期文件夹（年月日格式）
+    # 如果没有指定输出目录，使用日期文件夹（年月日格式），只计算一次
     if args.output is None:
-        date_folder = datetime.now().strftime("%Y-%m-%d")
-        args.output = f"./downloads/{date_folder}"
+        args.output = str(default_download_dir())
     
     # 如果需要下载音频但没有 FFmpeg，提示用户
     if args.audio and not check_ffmpeg():
@@ -293,10 +390,13 @@ def main():
         print("   将下载原始音频格式，不会转换为 MP3")
         print("   安装 FFmpeg 以获得更好的体验\n")
     
+    # 命令行是交互场景，URL 可疑时提示用户确认而不是直接报错
     if args.playlist or 'playlist' in args.url.lower():
-        download_playlist(args.url, args.output, args.quality, args.audio)
+        download_playlist(args.url, args.output, args.quality, args.audio,
+                          concurrent_frags=args.concurrent_frags, strict=False)
     else:
-        download_video(args.url, args.output, args.quality, args.audio)
+        download_video(args.url, args.output, args.quality, args.audio,
+                       concurrent_frags=args.concurrent_frags, strict=False)
 
 
 if __name__ == '__main__':
@@ -5,8 +5,11 @@
 直接运行，输入 URL 即可下载
 """
 
+import os
 import sys
+import time
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -18,48 +21,98 @@ except ImportError:
     sys.exit(1)
 
 
+@lru_cache(maxsize=None)
 def check_ffmpeg():
-    """检查 FFmpeg 是否已安装"""
+    """检查 FFmpeg 是否已安装（结果缓存：PATH 在进程内不会变）"""
     return shutil.which('ffmpeg') is not None
 
 
+# 跨运行持久化的 Cookie 文件：多次运行之间保留会话状态
+COOKIE_FILE = os.path.expanduser('~/.ytdownload/cookies.txt')
+
+# 保持连接复用：大量小请求（分片、字幕）时省去重复的 TCP+TLS 握手
+# 不声明 br：brotli 不是 yt-dlp 的必装依赖，没装的环境会收到解不开的响应
+HTTP_HEADERS = {'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'}
+
+# 下载根目录（常量便于测试时替换）
+DOWNLOAD_ROOT = Path('./downloads')
+
+
+def default_download_dir():
+    """默认下载目录：downloads/年-月-日（在入口处调用一次，跨午夜也不会变）"""
+    return DOWNLOAD_ROOT / datetime.now().strftime('%Y-%m-%d')
+
+
+def has_srt(dirpath):
+    """检查目录下是否已有 .srt 字幕文件（os.scandir 找到第一个就返回）"""
+    with os.scandir(dirpath) as it:
+        return any(entry.name.endswith('.srt') for entry in it)
+
+
+# 进度输出的最小间隔（秒）：yt-dlp 每秒回调很多次，每次打印都是一次系统调用
+_PROGRESS_INTERVAL = 0.2
+_last_emit = [0.0]
+
+
 def download_progress_hook(d):
-    """下载进度回调"""
+    """下载进度回调（节流：最多每 0.2 秒刷新一次）"""
     if d['status'] == 'downloading':
+        now = time.monotonic()
+        if now - _last_emit[0] < _PROGRESS_INTERVAL:
+            return
+        _last_emit[0] = now
         if '_percent_str' in d:
             speed_str = d.get('_speed_str', 'N/A')
             eta_str = d.get('_eta_str', 'N/A')
-            print(f"\r下载中: {d['_percent_str']} | 速度: {speed_str} | 剩余时间: {eta_str}", end='', flush=True)
+            sys.stdout.write(f"\r下载中: {d['_percent_str']} | 速度: {speed_str} | 剩余时间: {eta_str}")
+            sys.stdout.flush()
     elif d['status'] == 'finished':
         print("\n✅ 下载完成，正在处理...")
 
 
-def simple_download():
-    """简单的交互式下载 - 默认最高质量"""
+def simple_download(download_dir=None):
+    """简单的交互式下载 - 默认最高质量
+
+    Args:
+        download_dir: 下载保存目录；不传则用当天的日期文件夹（入口处算一次）
+    """
+    # 使用日期创建下载文件夹（年月日格式），只计算一次
+    if download_dir is None:
+        download_dir = str(default_download_dir())
+
     print("\n" + "="*60)
     print("  YouTube 视频下载器 - 自动最高质量")
     print("="*60 + "\n")
-    
+
     # 获取 URL
     url = input("请输入 YouTube 视频 URL: ").strip()
     if not url:
         print("❌ URL 不能为空！")
         return
-    
-    # 使用日期创建下载文件夹（年月日格式）
-    date_folder = datetime.now().strftime("%Y-%m-%d")
-    download_dir = f"./downloads/{date_folder}"
+
     output_path = Path(download_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    if not output_path.is_dir():  # 先 stat 一次，目录已存在时省掉逐级 mkdir 系统调用
+        output_path.mkdir(parents=True, exist_ok=True)
+    cookie_dir = Path(COOKIE_FILE).parent
+    if not cookie_dir.is_dir():
+        cookie_dir.mkdir(parents=True, exist_ok=True)
     
     # 配置下载选项 - 默认最高质量
     ydl_opts = {
         'outtmpl': str(output_path / '%(title)s.%(ext)s'),
         'format': 'bestvideo[ext=mp4][vcodec^=avc]+bestaudio[ext=m4a]/best',
         'merge_output_format': 'mp4',
+        # 合并时只做流拷贝（不重新编码），+faststart 便于边传边播
+        'postprocessor_args': {'ffmpeg': ['-c', 'copy', '-movflags', '+faststart']},
         'progress_hooks': [download_progress_hook],
         'quiet': False,
         'no_warnings': False,
+        'concurrent_fragment_downloads': 8,  # HLS/DASH 分片并发下载
+        'http_chunk_size': 10485760,  # 非分片下载时按 10MB 块并行
+        'cookiefile': COOKIE_FILE,  # Cookie 跨运行持久化
+        'http_headers': HTTP_HEADERS,  # 连接复用
+        'socket_timeout': 30,
+
         # 字幕下载配置（优先英文和中文，如果都没有则下载任意可用字幕）
         'writesubtitles': True,          # 下载手动字幕
         'writeautomaticsub': True,      # 下载自动生成的字幕（如果手动字幕不可用）
@@ -77,14 +130,20 @@ def simple_download():
             ydl.download([url])
             
             # 检查是否有字幕文件，如果没有，尝试下载任意可用字幕
-            subtitle_files = list(output_path.glob('*.srt'))
-            if not subtitle_files:
+            if not has_srt(output_path):
                 print("⚠️  优先语言（英文/中文）字幕不可用，尝试下载任意可用字幕...")
-                fallback_opts = ydl_opts.copy()
-                # 移除语言限制，但只下载一个字幕（通过不设置allsubtitles）
-                fallback_opts.pop('subtitleslangs', None)  # 移除语言限制
-                fallback_opts['allsubtitles'] = False  # 只下载一个字幕
-                fallback_opts['skip_download'] = True  # 只下载字幕，不重复下载视频
+                # 显式构造，不从 ydl_opts 浅拷贝：浅拷贝会共享
+                # progress_hooks 等列表，fallback 一改就污染主配置
+                fallback_opts = {
+                    'outtmpl': ydl_opts['outtmpl'],
+                    'writesubtitles': True,          # 下载手动字幕
+                    'writeautomaticsub': True,       # 下载自动生成的字幕
+                    'subtitleformat': 'srt',         # 字幕格式为SRT
+                    'allsubtitles': False,           # 只下载一个字幕（无语言限制）
+                    'skip_download': True,           # 只下载字幕，不重复下载视频
+                    'quiet': True,
+                    'ignoreerrors': True,
+                }
                 try:
                     with YoutubeDL(fallback_opts) as ydl_fallback:
                         ydl_fallback.download([url])